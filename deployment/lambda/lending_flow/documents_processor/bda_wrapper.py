@@ -6,21 +6,27 @@ import json
 import os
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
+from botocore.config import Config
 import requests
 import re
 
 ENDPOINT_RUNTIME = os.environ.get('BDA_RUNTIME_ENDPOINT', None)
 
-# Create a Bedrock client
-bda_client_runtime = boto3.client("bedrock-data-automation-runtime",
+# Get the AWS Session, shared by all clients of this container
+session = boto3.Session()
+
+# Create a Bedrock client once per container, so warm invocations reuse its pooled keep-alive connections
+# The pool is larger than the handler's thread count, and adaptive retries back off when BDA throttles
+bda_client_config = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True
+)
+bda_client_runtime = session.client("bedrock-data-automation-runtime",
                                 **({'endpoint_url': ENDPOINT_RUNTIME} if ENDPOINT_RUNTIME is not None else {}),
+                                config=bda_client_config,
                                 verify=True)
 
-# Get the AWS Session
-session = boto3.Session()
-
-# Create a Bedrock client
-bda_client = boto3.client("bedrock-data-automation-runtime") 
 # Get Region
 region_name = session.region_name
 
@@ -36,8 +42,6 @@ def bda_sdk(bda_client_runtime, url_path ="data-automation-projects/", method ="
         host = re.sub(r'.runtime+', '', host)
         url = re.sub(r'.runtime+', '', url)
 
-    session = boto3.Session()
-
     request = AWSRequest(
         method,
         url,
@@ -53,22 +57,11 @@ def bda_sdk(bda_client_runtime, url_path ="data-automation-projects/", method ="
     data = json.loads(content)
     return data
 
-# get the project arn based on the name
-def get_project_arn(project_name):
-    list_results = bda_sdk(bda_client_runtime=bda_client_runtime, url_path="data-automation-projects/", method="POST",
-                           payload={})
-    # get the project arn
-    projects_filtered = [item for item in list_results["projects"] if project_name == item["projectName"]]
-    if len(projects_filtered) == 0:
-        raise Exception(f"Project {project_name} not found")
-    project_arn = projects_filtered[0]["projectArn"]
-    return project_arn
-
 # invokes bda by async approach with a given pdf input file
 def invoke_insight_generation_async(
         input_s3_uri,
         output_s3_uri,
-        data_project_arn, blueprints = None):
+        data_project_arn, blueprints = None, client_token = None):
 
     payload = {
         "inputConfiguration": {
@@ -89,6 +82,10 @@ def invoke_insight_generation_async(
         # ]
     }
 
+    # BDA starts a single job per client token, so duplicate requests don't create duplicate jobs
+    if client_token is not None:
+        payload["clientToken"] = client_token
+
     response = bda_client_runtime.invoke_data_automation_async(**payload)
     print(response)
     return response
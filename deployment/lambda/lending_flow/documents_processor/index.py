@@ -7,13 +7,15 @@ import json
 import json
 import uuid
 import os
+import hashlib
 import boto3
-from bda_wrapper import invoke_insight_generation_async, bda_sdk, get_project_arn
+from concurrent.futures import ThreadPoolExecutor
+from bda_wrapper import invoke_insight_generation_async, bda_sdk
 import random, string
 
 
 BDA_RUNTIME_ENDPOINT = os.environ.get('BDA_RUNTIME_ENDPOINT', None)
-DATA_PROJECT_NAME = os.environ.get('DATA_PROJECT_NAME', None)
+DATA_PROJECT_ARN = os.environ.get('DATA_PROJECT_ARN', None)
 TARGET_BUCKET_NAME = os.environ.get('TARGET_BUCKET_NAME', None)
 
 
@@ -22,24 +24,54 @@ s3 = boto3.client("s3")
 def get_claim_reference_id(key):
     return key.split('/', 1)[0] if '/' in key else ''.join(random.choices(string.ascii_letters + string.digits, k=6))
 
-def lambda_handler(event, context):
-
-    print(f"Received event: {event}")
+# EventBridge and SQS deliver at least once, so the same upload can be processed more than once
+# The token is derived from the object's version ID if the bucket is versioned, otherwise from the event's
+# sequencer, which is unique per PUT. Redeliveries of one upload share a token, while re-uploading the same
+# file to the same key gets a new one (unlike the ETag, which only depends on the content)
+def get_client_token(bucket, key, object_detail):
+    version = object_detail.get('version-id') or object_detail['sequencer']
+    return hashlib.sha256(f"{bucket}/{key}/{version}".encode()).hexdigest()
 
-    # Generate a unique ID using UUID4
-    bucket = event['detail']['bucket']['name']
-    key = event['detail']['object']['key']
-    targetkey = key.replace("documents", "documents-output")
+def process_document(record):
+    # Each SQS record body holds one S3 "Object Created" EventBridge event
+    # Parsed here, in the worker, so a malformed record only fails that record
+    detail = json.loads(record['body'])['detail']
+    bucket = detail['bucket']['name']
+    key = detail['object']['key']
+    # The empty ".placeholder" files that create the folders at deploy time, and the zero-byte "folder/"
+    # keys created by the S3 console's "Create folder", are not documents
+    if key.endswith(('.placeholder', '/')):
+        print(f"Skipping placeholder file: {key}")
+        return None
+    # documents/<file> -> documents-output/<file>, samples/<file> -> samples-output/<file>
+    folder, filename = key.split('/', 1)
+    targetkey = f"{folder}-output/{filename}"
     input_s3_uri = f"s3://{bucket}/{key}"
     output_s3_uri = f"s3://{TARGET_BUCKET_NAME}/{targetkey}"
 
     print(f"input_s3_uri: {input_s3_uri}")
     print(f"output_s3_uri: {output_s3_uri}")
 
-    project_arn = get_project_arn(DATA_PROJECT_NAME)
+    # invoke insight generation (project ARN is resolved at deploy time)
+    return invoke_insight_generation_async(input_s3_uri, output_s3_uri, data_project_arn=DATA_PROJECT_ARN,
+                                           client_token=get_client_token(bucket, key, detail['object']))
+
+def lambda_handler(event, context):
+
+    print(f"Received event: {event}")
+
+    # The records of a batch are submitted concurrently (the boto3 client is thread-safe)
+    records = event['Records']
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(process_document, record) for record in records]
 
-    # invoke insight generation
-    response = invoke_insight_generation_async(input_s3_uri, output_s3_uri, data_project_arn=project_arn)
+    # Report failed records only, so successfully submitted documents aren't retried
+    batch_item_failures = []
+    for record, future in zip(records, futures):
+        try:
+            print(future.result())
+        except Exception as e:
+            print(f"Failed to process message {record['messageId']}: {e}")
+            batch_item_failures.append({"itemIdentifier": record['messageId']})
 
-    print(response)
-    return response
+    return {"batchItemFailures": batch_item_failures}
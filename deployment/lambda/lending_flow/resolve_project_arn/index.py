@@ -0,0 +1,38 @@
+import boto3
+
+# Create a Bedrock Data Automation control plane client
+bda_client = boto3.client("bedrock-data-automation")
+
+def get_project_arn(project_name:str):
+    paginator = bda_client.get_paginator("list_data_automation_projects")
+    for page in paginator.paginate():
+        for item in page["projects"]:
+            if project_name == item["projectName"]:
+                return item["projectArn"]
+    raise ValueError(f"Project {project_name} not found")
+
+
+def on_event(event, context):
+    """
+    This function is the entry point for the Lambda function.
+    It resolves the Bedrock Data Automation project name in the resource properties
+    to its ARN at deploy time, so the document processor doesn't have to look it up at runtime.
+    """
+    resourceProperties = event["ResourceProperties"]
+    request_type = event['RequestType']
+    if "projectName" not in resourceProperties:
+        raise ValueError("projectName not provided in the resource properties")
+    projectName = resourceProperties["projectName"]
+    response = None
+    if request_type in ['Create','Update']:
+        response = {
+            "PhysicalResourceId": projectName,
+            "Data": {
+                "projectArn": get_project_arn(projectName)
+            }
+        }
+    if request_type == 'Delete':
+        physical_id = event["PhysicalResourceId"]
+        response = {'PhysicalResourceId': physical_id}
+    print(response)
+    return response
@@ -5,7 +5,8 @@
 """
 # Python Built-Ins:
 import os
-from typing import Optional
+import subprocess
+from typing import Optional, Union
 
 
 def bool_env_var(env_var_name: str, default: Optional[bool] = None) -> bool:
@@ -28,6 +29,67 @@ def bool_env_var(env_var_name: str, default: Optional[bool] = None) -> bool:
         if default is None:
             raise ValueError(f"Mandatory boolean env var '{env_var_name}' not found")
         return default
+    return parse_bool(raw, f"env var '{env_var_name}'")
+
+
+def bool_context_value(raw: Optional[Union[str, bool]], context_key: str, default: bool = False) -> bool:
+    """Parse a boolean CDK context value
+
+    Context values set in `cdk.json` may already be booleans, but `--context key=value` on the command
+    line always provides strings, so both are accepted.
+
+    Raises
+    ------
+    ValueError :
+        If the raw value string could not be interpreted as a boolean.
+
+    Returns
+    -------
+    parsed :
+        `default` if the context value is not set, otherwise the parsed value (same rules as
+        `bool_env_var`).
+    """
+    if raw is None:
+        return default
+    if isinstance(raw, bool):
+        return raw
+    return parse_bool(raw, f"context value '{context_key}'")
+
+
+def positive_int_context_value(raw: Optional[Union[str, int]], context_key: str) -> Optional[int]:
+    """Parse an optional positive integer CDK context value
+
+    Raises
+    ------
+    ValueError :
+        If the raw value could not be interpreted as an integer, or is lower than 1.
+
+    Returns
+    -------
+    parsed :
+        None if the context value is not set (or empty), otherwise the parsed integer.
+    """
+    if raw is None or raw == "":
+        return None
+    try:
+        parsed = int(raw)
+    except ValueError:
+        raise ValueError(
+            "Couldn't interpret context value '%s' as integer. Got: '%s'" % (context_key, raw)
+        )
+    if parsed < 1:
+        raise ValueError(f"Context value '{context_key}' must be at least 1. Got: {parsed}")
+    return parsed
+
+def parse_bool(raw: str, description: str) -> bool:
+    """Interpret a raw string such as `1`, `true`, `y`, `yes`, `0`, `false`, `n`, `no` as a boolean
+
+    Raises
+    ------
+    ValueError :
+        If the string could not be interpreted as a boolean. `description` names the value's origin in
+        the error message.
+    """
     raw = raw.lower()
     if raw in ("1", "true", "y", "yes"):
         return True
@@ -35,5 +97,29 @@ def bool_env_var(env_var_name: str, default: Optional[bool] = None) -> bool:
         return False
     else:
         raise ValueError(
-            "Couldn't interpret env var '%s' as boolean. Got: '%s'" % (env_var_name, raw)
+            "Couldn't interpret %s as boolean. Got: '%s'" % (description, raw)
         )
+
+def git_tree_hash(path: str) -> Optional[str]:
+    """Get the git tree hash of a directory, for use as a custom CDK asset hash
+
+    Using the tree hash lets CDK skip fingerprinting every file in the asset directory on each synth.
+
+    Returns
+    -------
+    tree_hash :
+        The hash of `path` in the committed HEAD tree, or None if `path` isn't in a git checkout or has
+        uncommitted changes or untracked or ignored files (e.g. __pycache__), which the asset would
+        still include. The caller should then fall back to CDK's default content-based hashing so
+        local edits are still picked up.
+    """
+    try:
+        if subprocess.check_output(
+            ["git", "status", "--porcelain", "--ignored", "--", path], stderr=subprocess.DEVNULL
+        ).strip():
+            return None
+        return subprocess.check_output(
+            ["git", "rev-parse", f"HEAD:./{path}"], stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None